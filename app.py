@@ -1,17 +1,26 @@
-import json
+import os
 import re
+import math
+import struct
+import asyncio
 import hashlib
+import threading
 from pathlib import Path
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from urllib.parse import urlparse
 from typing import Dict, List, Optional, Any, Tuple
-from collections import Counter
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from io import BytesIO
+from xml.etree import ElementTree
 
 import feedparser
+import httpx
+import orjson
 from dateutil import parser as dateparser
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -19,8 +28,26 @@ BASE = Path(__file__).parent
 FEEDS_FILE = BASE / "feeds.json"
 SOURCES_FILE = BASE / "sources.json"
 DB_FILE = BASE / "db.json"
+ARTICLES_LOG = BASE / "articles.jsonl"
+SEEN_FILE = BASE / "seen.bloom"
 
-app = FastAPI(title="OpenGround")
+MAX_ARTICLES = 3000
+# The articles log is rewritten down to MAX_ARTICLES once it holds this many records
+COMPACT_ARTICLES_AT = 2 * MAX_ARTICLES
+
+# Bloom filter sizing for article-id dedup (~1.8 MB on disk)
+SEEN_CAPACITY = 1_000_000
+SEEN_FP_RATE = 0.001
+
+FETCH_MAX_CONNECTIONS = 64
+FETCH_TIMEOUT = 15
+USER_AGENT = "Mozilla/5.0 (compatible; OpenGround/1.0; +https://github.com/Ahilan-1/openground)"
+
+# Weights of title similarity vs keyword overlap when clustering
+TEXT_WEIGHT = 0.65
+KEYWORD_WEIGHT = 0.35
+
+app = FastAPI(title="OpenGround", default_response_class=ORJSONResponse)
 app.mount("/static", StaticFiles(directory=str(BASE / "static")), name="static")
 templates = Jinja2Templates(directory=str(BASE / "templates"))
 
@@ -31,15 +58,36 @@ templates = Jinja2Templates(directory=str(BASE / "templates"))
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+# path -> ((mtime_ns, size), parsed data); unchanged files are not reparsed
+JSON_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+def load_cached(path: Path, parse, default):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return default
+    key = (st.st_mtime_ns, st.st_size)
+    cached = JSON_CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = parse(path.read_bytes())
+    JSON_CACHE[path] = (key, data)
+    return data
+
 def load_json(path: Path, default):
-    if path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
-    return default
+    return load_cached(path, orjson.loads, default)
 
 def save_json(path: Path, data):
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    st = path.stat()
+    JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size), data)
 
 def stable_id(*parts: str) -> str:
+    s = "|".join([p.strip() for p in parts if p is not None])
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=16).hexdigest()
+
+def legacy_stable_id(*parts: str) -> str:
+    """SHA-256 id used before stable_id switched to blake2b"""
     s = "|".join([p.strip() for p in parts if p is not None])
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
@@ -57,6 +105,28 @@ def parse_date(entry) -> Optional[str]:
                 pass
     return None
 
+def parse_ts(value: Optional[str]) -> Optional[float]:
+    """Unix timestamp of an ISO date string, or None if it does not parse"""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+def article_ts(article: Dict[str, Any]) -> Optional[float]:
+    """Timestamp of an article's published (or fetched) date.
+
+    Set as `pub_ts` at ingest; computed and stored on first use for older
+    articles.
+    """
+    if "pub_ts" not in article:
+        article["pub_ts"] = parse_ts(article.get("published") or article.get("fetched_at"))
+    return article["pub_ts"]
+
 def domain_of(url: str) -> str:
     try:
         netloc = urlparse(url).netloc.lower()
@@ -65,100 +135,105 @@ def domain_of(url: str) -> str:
     except Exception:
         return ""
 
+# ASCII quotes are dropped and any other ASCII character outside
+# [\w\s-] becomes a space; NONWORD_RE covers the non-ASCII remainder.
+TITLE_TRANSLATE = str.maketrans({
+    chr(c): (None if chr(c) in "\"'" else " ")
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in "_-")
+})
+NONWORD_RE = re.compile(r"[^\w\s-]")
+TITLE_STOPWORDS = frozenset(["the", "a", "an"])
+
 def norm_title(title: str) -> str:
     """Normalize title for comparison"""
-    t = title.lower().strip()
-    t = re.sub(r"[\"'""'']", "", t)
-    t = re.sub(r"[^\w\s-]", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    stop = set(["the", "a", "an"])
-    toks = [w for w in t.split() if w not in stop]
+    t = title.lower().translate(TITLE_TRANSLATE)
+    if not t.isascii():
+        t = NONWORD_RE.sub(" ", t)
+    toks = [w for w in t.split() if w not in TITLE_STOPWORDS]
     return " ".join(toks)
 
-def get_comprehensive_stopwords() -> set:
-    """Comprehensive list of words to filter from trending topics"""
-    return set([
-        'the', 'a', 'an', 'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her',
-        'its', 'our', 'their', 'all', 'some', 'any', 'each', 'every', 'both', 'few',
-        'more', 'most', 'other', 'another', 'such', 'what', 'which', 'who', 'whom',
-        'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
-        'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-        'must', 'can', 'get', 'make', 'take', 'come', 'go', 'say', 'tell', 'give',
-        'find', 'think', 'know', 'want', 'look', 'use', 'seem', 'keep', 'let', 'put',
-        'mean', 'leave', 'call', 'ask', 'work', 'try', 'feel', 'become', 'show', 'turn',
-        'bring', 'follow', 'begin', 'run', 'hold', 'write', 'stand', 'hear', 'help',
-        'play', 'move', 'live', 'believe', 'happen', 'appear', 'continue', 'set',
-        'change', 'lead', 'understand', 'watch', 'need', 'add', 'allow', 'spend',
-        'grow', 'open', 'walk', 'win', 'offer', 'remember', 'love', 'consider', 'buy',
-        'wait', 'serve', 'die', 'send', 'expect', 'build', 'stay', 'fall', 'reach',
-        'kill', 'remain', 'suggest', 'raise', 'pass', 'sell', 'require', 'report',
-        'decide', 'pull', 'to', 'of', 'in', 'on', 'at', 'by', 'for', 'with', 'from',
-        'as', 'into', 'about', 'after', 'before', 'between', 'through', 'during',
-        'within', 'without', 'under', 'over', 'above', 'below', 'up', 'down', 'out',
-        'off', 'against', 'among', 'around', 'behind', 'beside', 'near', 'across',
-        'along', 'toward', 'until', 'upon', 'via', 'and', 'or', 'but', 'nor', 'so',
-        'yet', 'also', 'too', 'very', 'then', 'now', 'just', 'only', 'even', 'back',
-        'well', 'still', 'again', 'never', 'always', 'often', 'sometimes', 'usually',
-        'really', 'why', 'how', 'when', 'where', 'says', 'said', 'according', 'news',
-        'latest', 'update', 'breaking', 'live', 'today', 'yesterday', 'tomorrow',
-        'tonight', 'morning', 'evening', 'night', 'day', 'week', 'month', 'year',
-        'time', 'first', 'second', 'third', 'last', 'next', 'new', 'old', 'good',
-        'bad', 'best', 'worst', 'better', 'worse', 'big', 'small', 'large', 'little',
-        'long', 'short', 'high', 'low', 'top', 'many', 'much', 'less', 'way', 'thing',
-        'people', 'person', 'man', 'woman', 'men', 'women', 'child', 'children', 'life',
-        'world', 'country', 'city', 'place', 'home', 'house', 'right', 'left', 'side',
-        'end', 'part', 'number', 'case', 'point', 'fact', 'hand', 'eye', 'face', 'like',
-        'different', 'same', 'own', 'going', 'doing', 'being', 'having', 'making',
-        'getting', 'coming', 'seen', 'saw', 'see', 'looks', 'looked', 'looking',
-        'found', 'everything', 'something', 'anything', 'nothing', 'everyone', 'someone',
-        'anyone', 'one', 'two', 'three', 'four', 'five', 'video', 'photo', 'image',
-        'here', 'there', 'yes', 'yeah', 'okay'
-    ])
+# Comprehensive list of words to filter from trending topics
+STOPWORDS = frozenset([
+    'the', 'a', 'an', 'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her',
+    'its', 'our', 'their', 'all', 'some', 'any', 'each', 'every', 'both', 'few',
+    'more', 'most', 'other', 'another', 'such', 'what', 'which', 'who', 'whom',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+    'must', 'can', 'get', 'make', 'take', 'come', 'go', 'say', 'tell', 'give',
+    'find', 'think', 'know', 'want', 'look', 'use', 'seem', 'keep', 'let', 'put',
+    'mean', 'leave', 'call', 'ask', 'work', 'try', 'feel', 'become', 'show', 'turn',
+    'bring', 'follow', 'begin', 'run', 'hold', 'write', 'stand', 'hear', 'help',
+    'play', 'move', 'live', 'believe', 'happen', 'appear', 'continue', 'set',
+    'change', 'lead', 'understand', 'watch', 'need', 'add', 'allow', 'spend',
+    'grow', 'open', 'walk', 'win', 'offer', 'remember', 'love', 'consider', 'buy',
+    'wait', 'serve', 'die', 'send', 'expect', 'build', 'stay', 'fall', 'reach',
+    'kill', 'remain', 'suggest', 'raise', 'pass', 'sell', 'require', 'report',
+    'decide', 'pull', 'to', 'of', 'in', 'on', 'at', 'by', 'for', 'with', 'from',
+    'as', 'into', 'about', 'after', 'before', 'between', 'through', 'during',
+    'within', 'without', 'under', 'over', 'above', 'below', 'up', 'down', 'out',
+    'off', 'against', 'among', 'around', 'behind', 'beside', 'near', 'across',
+    'along', 'toward', 'until', 'upon', 'via', 'and', 'or', 'but', 'nor', 'so',
+    'yet', 'also', 'too', 'very', 'then', 'now', 'just', 'only', 'even', 'back',
+    'well', 'still', 'again', 'never', 'always', 'often', 'sometimes', 'usually',
+    'really', 'why', 'how', 'when', 'where', 'says', 'said', 'according', 'news',
+    'latest', 'update', 'breaking', 'live', 'today', 'yesterday', 'tomorrow',
+    'tonight', 'morning', 'evening', 'night', 'day', 'week', 'month', 'year',
+    'time', 'first', 'second', 'third', 'last', 'next', 'new', 'old', 'good',
+    'bad', 'best', 'worst', 'better', 'worse', 'big', 'small', 'large', 'little',
+    'long', 'short', 'high', 'low', 'top', 'many', 'much', 'less', 'way', 'thing',
+    'people', 'person', 'man', 'woman', 'men', 'women', 'child', 'children', 'life',
+    'world', 'country', 'city', 'place', 'home', 'house', 'right', 'left', 'side',
+    'end', 'part', 'number', 'case', 'point', 'fact', 'hand', 'eye', 'face', 'like',
+    'different', 'same', 'own', 'going', 'doing', 'being', 'having', 'making',
+    'getting', 'coming', 'seen', 'saw', 'see', 'looks', 'looked', 'looking',
+    'found', 'everything', 'something', 'anything', 'nothing', 'everyone', 'someone',
+    'anyone', 'one', 'two', 'three', 'four', 'five', 'video', 'photo', 'image',
+    'here', 'there', 'yes', 'yeah', 'okay'
+])
 
 def extract_keywords(title: str, min_length: int = 4) -> set:
     """Extract meaningful keywords from title"""
     normalized = norm_title(title)
     words = normalized.split()
-    stop_words = get_comprehensive_stopwords()
     
     keywords = set()
     for w in words:
         if (len(w) >= min_length and 
-            w not in stop_words and 
+            w not in STOPWORDS and 
             not w.isdigit() and
             not all(c.isdigit() or c in ['-', '/', ':'] for c in w)):
             keywords.add(w)
     
     return keywords
 
+BAD_SUFFIXES = ('ing', 'ed', 'ly', 'er', 'est')
+VOWELS = frozenset('aeiou')
+
 def is_meaningful_keyword(keyword: str) -> bool:
     """Validate keywords are meaningful"""
-    stop_words = get_comprehensive_stopwords()
-    
-    if keyword.lower() in stop_words:
-        return False
-    if len(keyword) < 4:
-        return False
-    if keyword.isdigit():
-        return False
-    if keyword.endswith(('ing', 'ed', 'ly', 'er', 'est')) and len(keyword) <= 6:
-        return False
-    if not any(c in 'aeiou' for c in keyword.lower()):
-        return False
-    if keyword.isupper() and len(keyword) < 3:
-        return False
-    
-    return True
-
-def similarity(a: str, b: str) -> int:
-    return fuzz.token_sort_ratio(a, b)
-
-def keyword_overlap(keywords_a: set, keywords_b: set) -> float:
-    if not keywords_a or not keywords_b:
-        return 0.0
-    intersection = len(keywords_a & keywords_b)
-    union = len(keywords_a | keywords_b)
-    return intersection / union if union > 0 else 0.0
+    kw = keyword.lower()
+    return (
+        len(keyword) >= 4
+        and kw not in STOPWORDS
+        and not keyword.isdigit()
+        and not (len(keyword) <= 6 and keyword.endswith(BAD_SUFFIXES))
+        and not VOWELS.isdisjoint(kw)
+    )
+
+def sort_tokens(text: str) -> str:
+    """Token-sorted form of a title, so fuzz.ratio matches token_sort_ratio"""
+    return " ".join(sorted(text.split()))
+
+def keyword_bits(keywords, kw_bit: Dict[str, int]) -> int:
+    """Encode keywords as an int bitset, assigning new bits in kw_bit as needed"""
+    bits = 0
+    for kw in keywords:
+        b = kw_bit.get(kw)
+        if b is None:
+            b = kw_bit[kw] = 1 << len(kw_bit)
+        bits |= b
+    return bits
 
 
 # ------------------------
@@ -170,74 +245,312 @@ def load_feeds() -> Dict[str, List[str]]:
 def load_sources() -> Dict[str, Any]:
     return load_json(SOURCES_FILE, {})
 
+def article_sort_key(a: Dict[str, Any]) -> str:
+    return a.get("published") or a.get("fetched_at") or ""
+
+def parse_articles_log(body: bytes) -> Dict[str, Any]:
+    articles = [orjson.loads(line) for line in body.splitlines() if line.strip()]
+    records = len(articles)
+    articles.sort(key=article_sort_key, reverse=True)
+    return {"records": records, "articles": articles[:MAX_ARTICLES]}
+
+def cache_articles_log(records: int, articles: List[Dict[str, Any]]):
+    """Record what was just written so the next read does not reparse the log"""
+    st = ARTICLES_LOG.stat()
+    JSON_CACHE[ARTICLES_LOG] = ((st.st_mtime_ns, st.st_size), {"records": records, "articles": articles})
+
+def load_articles_log() -> Optional[Dict[str, Any]]:
+    """{"records": lines in the log, "articles": newest MAX_ARTICLES}, or None without a log"""
+    return load_cached(ARTICLES_LOG, parse_articles_log, None)
+
+def load_articles() -> Optional[List[Dict[str, Any]]]:
+    """Newest MAX_ARTICLES articles from the log, or None if there is no log yet"""
+    log = load_articles_log()
+    return log["articles"] if log is not None else None
+
+def append_articles(items: List[Dict[str, Any]]):
+    log = load_articles_log() or {"records": 0, "articles": []}
+    with open(ARTICLES_LOG, "ab") as f:
+        for item in items:
+            f.write(orjson.dumps(item) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+    articles = sorted(log["articles"] + items, key=article_sort_key, reverse=True)
+    cache_articles_log(log["records"] + len(items), articles[:MAX_ARTICLES])
+
+def write_articles_log(articles: List[Dict[str, Any]]):
+    tmp = ARTICLES_LOG.with_suffix(".jsonl.tmp")
+    tmp.write_bytes(b"".join(orjson.dumps(a) + b"\n" for a in articles))
+    os.replace(tmp, ARTICLES_LOG)
+    cache_articles_log(len(articles), articles[:MAX_ARTICLES])
+
+def compact_articles_log():
+    """Drop articles that fell out of the newest MAX_ARTICLES once the log grows large"""
+    log = load_articles_log()
+    if log is not None and log["records"] >= COMPACT_ARTICLES_AT:
+        write_articles_log(log["articles"])
+
+# Serializes the one-time move of legacy db.json data into its own files
+MIGRATE_LOCK = threading.Lock()
+
+def migrate_legacy_db(db: Dict[str, Any]):
+    """Move data embedded in an older db.json into its own files.
+
+    Articles go to ARTICLES_LOG and the seen-id map seeds SEEN_FILE. This
+    runs before save_db can drop either key from the snapshot.
+    """
+    needs_log = "articles" in db and not ARTICLES_LOG.exists()
+    needs_seen = "seen" in db and not SEEN_FILE.exists()
+    if not (needs_log or needs_seen):
+        return
+    with MIGRATE_LOCK:
+        if needs_log and not ARTICLES_LOG.exists():
+            write_articles_log(sorted(db["articles"], key=article_sort_key, reverse=True))
+        if needs_seen and not SEEN_FILE.exists():
+            seen = BloomFilter.for_capacity(SEEN_CAPACITY, SEEN_FP_RATE)
+            for aid in db["seen"]:
+                seen.add(aid)
+            seen.save(SEEN_FILE)
+
 def load_db() -> Dict[str, Any]:
-    return load_json(DB_FILE, {
-        "articles": [],
-        "seen": {},
+    """Load the stories snapshot with articles attached from the log.
+
+    The parsed db.json is shared through JSON_CACHE, so each caller gets a
+    shallow copy it can modify without touching the cached snapshot.
+    """
+    db = dict(load_json(DB_FILE, {
         "stories": [],
         "trending_topics": [],
         "last_updated": None
-    })
+    }))
+    migrate_legacy_db(db)
+    db["articles"] = load_articles() or []
+    return db
 
 def save_db(db: Dict[str, Any]):
+    """Write the snapshot; articles live in ARTICLES_LOG and seen ids in SEEN_FILE"""
     db["last_updated"] = now_iso()
-    save_json(DB_FILE, db)
+    save_json(DB_FILE, {k: v for k, v in db.items() if k not in ("articles", "seen")})
+
+
+# ------------------------
+# Seen-article dedup
+# ------------------------
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys, persisted as a flat bit array"""
+
+    HEADER = struct.Struct("<QI")
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: Optional[bytearray] = None):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fp_rate: float) -> "BloomFilter":
+        num_bits = math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        data = path.read_bytes()
+        num_bits, num_hashes = cls.HEADER.unpack_from(data)
+        return cls(num_bits, num_hashes, bytearray(data[cls.HEADER.size:]))
+
+    def save(self, path: Path):
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(self.HEADER.pack(self.num_bits, self.num_hashes) + self.bits)
+        os.replace(tmp, path)
+
+    def _positions(self, key: str):
+        # Double hashing: two 64-bit halves of one digest generate all k probes
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+def load_seen() -> BloomFilter:
+    """Load the seen-id filter; a legacy `seen` map was moved in by load_db"""
+    if SEEN_FILE.exists():
+        return BloomFilter.load(SEEN_FILE)
+    return BloomFilter.for_capacity(SEEN_CAPACITY, SEEN_FP_RATE)
 
 
 # ------------------------
 # RSS ingestion
 # ------------------------
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+FEED_ROOT_RE = re.compile(rb"<(rss|feed)[\s>]")
+
+# element tag -> entry field for each feed kind; only what fetch_articles reads
+RSS_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "summary",
+    "pubDate": "published",
+    DC_DATE: "updated",
+}
+ATOM_FIELDS = {
+    ATOM_NS + "title": "title",
+    ATOM_NS + "summary": "summary",
+    ATOM_NS + "content": "content",
+    ATOM_NS + "published": "published",
+    ATOM_NS + "updated": "updated",
+}
+
+def parse_feed_fast(body: bytes) -> Optional[Tuple[Optional[str], List[Dict[str, str]]]]:
+    """Stream plain RSS 2.0 / Atom feeds with ElementTree.
+
+    Returns (feed title, entries), or None when the feed type is not
+    recognised or the document does not parse, so the caller can fall back
+    to feedparser.
+    """
+    m = FEED_ROOT_RE.search(body, 0, 1024)
+    if not m:
+        return None
+    if m.group(1) == b"rss":
+        entry_tag, title_tag, fields = "item", "title", RSS_FIELDS
+    else:
+        entry_tag, title_tag, fields = ATOM_NS + "entry", ATOM_NS + "title", ATOM_FIELDS
+
+    feed_title = None
+    entries = []
+    entry = None
+    try:
+        for event, el in ElementTree.iterparse(BytesIO(body), events=("start", "end")):
+            tag = el.tag
+            if event == "start":
+                if tag == entry_tag:
+                    entry = {}
+                continue
+
+            if entry is None:
+                if tag == title_tag and feed_title is None:
+                    feed_title = "".join(el.itertext()).strip()
+            elif tag == entry_tag:
+                entries.append(entry)
+                entry = None
+                el.clear()
+            elif tag == ATOM_NS + "link" and fields is ATOM_FIELDS:
+                if el.get("rel", "alternate") == "alternate" and "link" not in entry:
+                    entry["link"] = el.get("href", "")
+            elif tag in fields:
+                entry.setdefault(fields[tag], "".join(el.itertext()))
+    except ElementTree.ParseError:
+        return None
+
+    if not entries:
+        return None
+    for e in entries:
+        if "summary" not in e and "content" in e:
+            e["summary"] = e["content"]
+    return feed_title, entries
+
+def parse_feed(body: bytes) -> Tuple[Optional[str], List[Any]]:
+    fast = parse_feed_fast(body)
+    if fast is not None:
+        return fast
+    f = feedparser.parse(body)
+    return f.feed.get("title"), f.entries
+
+async def fetch_and_parse(client: httpx.AsyncClient, url: str):
+    resp = await client.get(url)
+    resp.raise_for_status()
+    # Parsing is CPU-bound; keep it off the event loop so downloads
+    # continue while earlier feeds are parsed
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, parse_feed, resp.content)
+
+async def fetch_all_feeds(urls: List[str]) -> List[Any]:
+    """Fetch and parse all feeds concurrently over one HTTP/2 client.
+
+    Results are in the order of `urls`; a failed feed yields its exception.
+    """
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=FETCH_TIMEOUT,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_connections=FETCH_MAX_CONNECTIONS)
+    ) as client:
+        return await asyncio.gather(
+            *(fetch_and_parse(client, url) for url in urls),
+            return_exceptions=True
+        )
+
+def fetch_feeds(urls: List[str]) -> List[Any]:
+    return asyncio.run(fetch_all_feeds(urls))
+
 def fetch_articles() -> int:
     feeds = load_feeds()
     db = load_db()
-    seen = db["seen"]
+    seen = load_seen()
     added = 0
     all_new = []
 
-    for category, urls in feeds.items():
-        for url in urls:
-            print(f"Fetching {url}...")
-            try:
-                f = feedparser.parse(url)
-                source_title = f.feed.get("title", url)
-                for e in f.entries[:50]:
-                    title = (e.get("title") or "").strip()
-                    link = (e.get("link") or "").strip()
-                    if not title or not link:
-                        continue
-
-                    aid = stable_id(title.lower(), link)
-                    if aid in seen:
-                        continue
-
-                    item = {
-                        "id": aid,
-                        "title": title,
-                        "title_norm": norm_title(title),
-                        "keywords": list(extract_keywords(title)),
-                        "link": link,
-                        "domain": domain_of(link),
-                        "summary": strip_html(e.get("summary") or e.get("description") or ""),
-                        "published": parse_date(e),
-                        "source_feed": source_title,
-                        "category": category,
-                        "fetched_at": now_iso()
-                    }
-                    all_new.append(item)
-                    seen[aid] = link
-                    added += 1
-            except Exception as e:
-                print(f"Error fetching {url}: {e}")
-
-    db["articles"].extend(all_new)
-
-    def sort_key(a):
-        return a.get("published") or a.get("fetched_at") or ""
-
-    db["articles"].sort(key=sort_key, reverse=True)
-    db["articles"] = db["articles"][:3000]
-    db["seen"] = seen
-    save_db(db)
+    tasks = [(category, url) for category, urls in feeds.items() for url in urls]
+    results = fetch_feeds([url for _, url in tasks])
+
+    for (category, url), res in zip(tasks, results):
+        if isinstance(res, Exception):
+            print(f"Error fetching {url}: {res}")
+            continue
+        print(f"Fetched {url}")
+        try:
+            source_title, entries = res
+            source_title = source_title or url
+            for e in entries[:50]:
+                title = (e.get("title") or "").strip()
+                link = (e.get("link") or "").strip()
+                if not title or not link:
+                    continue
+
+                aid = stable_id(title.lower(), link)
+                if aid in seen:
+                    continue
+                # Articles seen before the id change are recorded under their
+                # SHA-256 id; record the new id so the next check is direct
+                if legacy_stable_id(title.lower(), link) in seen:
+                    seen.add(aid)
+                    continue
+
+                published = parse_date(e)
+                fetched_at = now_iso()
+                item = {
+                    "id": aid,
+                    "title": title,
+                    "title_norm": norm_title(title),
+                    "keywords": list(extract_keywords(title)),
+                    "link": link,
+                    "domain": domain_of(link),
+                    "summary": strip_html(e.get("summary") or e.get("description") or ""),
+                    "published": published,
+                    "source_feed": source_title,
+                    "category": category,
+                    "fetched_at": fetched_at,
+                    "pub_ts": parse_ts(published or fetched_at)
+                }
+                all_new.append(item)
+                seen.add(aid)
+                added += 1
+        except Exception as e:
+            print(f"Error parsing {url}: {e}")
+
+    if all_new:
+        append_articles(all_new)
+        compact_articles_log()
+    if all_new or not SEEN_FILE.exists():
+        seen.save(SEEN_FILE)
     print(f"Added {added} new articles")
     return added
 
@@ -247,34 +560,32 @@ def fetch_articles() -> int:
 # ------------------------
 def detect_trending_topics(articles: List[Dict[str, Any]], hours: int = 24) -> List[Dict[str, Any]]:
     """Detect trending topics based on keyword frequency"""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    now_ts = datetime.now(timezone.utc).timestamp()
+    cutoff = now_ts - hours * 3600
     
     recent = []
     for a in articles:
-        pub = a.get("published") or a.get("fetched_at")
-        if pub:
-            try:
-                dt = datetime.fromisoformat(pub.replace('Z', '+00:00'))
-                if dt > cutoff:
-                    recent.append(a)
-            except:
-                pass
+        ts = article_ts(a)
+        if ts is not None and ts > cutoff:
+            recent.append(a)
     
     print(f"Analyzing {len(recent)} recent articles for trending topics...")
     
     keyword_counts = Counter()
-    keyword_articles = {}
+    keyword_articles = defaultdict(list)
+    recent_keywords = [(a, set(a.get("keywords", []))) for a in recent]
+
+    # Validate each distinct keyword once rather than once per article
+    meaningful = frozenset(
+        kw for kw in set().union(*(kws for _, kws in recent_keywords))
+        if is_meaningful_keyword(kw)
+    )
     
-    for a in recent:
-        keywords = set(a.get("keywords", []))
+    for a, keywords in recent_keywords:
         for kw in keywords:
-            if not is_meaningful_keyword(kw):
-                continue
-            
-            keyword_counts[kw] += 1
-            if kw not in keyword_articles:
-                keyword_articles[kw] = []
-            keyword_articles[kw].append(a)
+            if kw in meaningful:
+                keyword_counts[kw] += 1
+                keyword_articles[kw].append(a)
     
     trending = []
     for kw, count in keyword_counts.most_common(50):
@@ -285,17 +596,8 @@ def detect_trending_topics(articles: List[Dict[str, Any]], hours: int = 24) -> L
             if len(domains) < 3:
                 continue
             
-            last_6h = datetime.now(timezone.utc) - timedelta(hours=6)
-            recent_count = 0
-            for a in articles_with_kw:
-                pub = a.get("published") or a.get("fetched_at")
-                if pub:
-                    try:
-                        dt = datetime.fromisoformat(pub.replace('Z', '+00:00'))
-                        if dt > last_6h:
-                            recent_count += 1
-                    except:
-                        pass
+            last_6h = now_ts - 6 * 3600
+            recent_count = sum(1 for a in articles_with_kw if a["pub_ts"] > last_6h)
             
             velocity = recent_count / count if count > 0 else 0
             
@@ -347,28 +649,19 @@ def get_dominant_bias(distribution: Dict[str, int]) -> str:
 
 def generate_story_timeline(story: Dict[str, Any]) -> Dict[str, Any]:
     """Generate timeline showing how story evolved"""
-    articles = story.get("articles", [])
-    
-    timeline_items = []
-    for a in articles:
-        pub = a.get("published") or a.get("fetched_at")
-        if pub:
-            try:
-                dt = datetime.fromisoformat(pub.replace('Z', '+00:00'))
-                timeline_items.append({
-                    "timestamp": pub,
-                    "datetime": dt,
-                    "title": a.get("title"),
-                    "publisher": a.get("publisher_name") or a.get("domain"),
-                    "bias_bucket": a.get("bias_bucket", "unknown"),
-                    "bias_score": a.get("bias_score", 0.0),
-                    "link": a.get("link"),
-                    "summary": a.get("summary", "")
-                })
-            except:
-                pass
+    dated = [(ts, a) for a in story.get("articles", []) if (ts := article_ts(a)) is not None]
+    dated.sort(key=lambda x: x[0])
     
-    timeline_items.sort(key=lambda x: x["datetime"])
+    stamps = [ts for ts, _ in dated]
+    timeline_items = [{
+        "timestamp": a.get("published") or a.get("fetched_at"),
+        "title": a.get("title"),
+        "publisher": a.get("publisher_name") or a.get("domain"),
+        "bias_bucket": a.get("bias_bucket", "unknown"),
+        "bias_score": a.get("bias_score", 0.0),
+        "link": a.get("link"),
+        "summary": a.get("summary", "")
+    } for _, a in dated]
     
     if not timeline_items:
         return {
@@ -380,35 +673,26 @@ def generate_story_timeline(story: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     first = timeline_items[0]
-    last = timeline_items[-1]
-    span_hours = (last["datetime"] - first["datetime"]).total_seconds() / 3600
+    span_hours = (stamps[-1] - stamps[0]) / 3600
     
-    # Group into 6-hour phases
+    # Group into 6-hour phases: a phase opens at its first article and takes
+    # every later article within 6 hours of it
     phases = []
-    current_phase = {
-        "start": first["datetime"],
-        "articles": [],
-        "bias_distribution": {"left": 0, "center": 0, "right": 0, "unknown": 0}
-    }
-    
-    phase_duration = timedelta(hours=6)
+    phase_seconds = 6 * 3600
+    start = 0
     
-    for item in timeline_items:
-        if item["datetime"] - current_phase["start"] > phase_duration:
-            if current_phase["articles"]:
-                phases.append(current_phase)
-            current_phase = {
-                "start": item["datetime"],
-                "articles": [],
-                "bias_distribution": {"left": 0, "center": 0, "right": 0, "unknown": 0}
-            }
-        
-        current_phase["articles"].append(item)
-        bucket = item.get("bias_bucket", "unknown")
-        current_phase["bias_distribution"][bucket] += 1
-    
-    if current_phase["articles"]:
-        phases.append(current_phase)
+    while start < len(stamps):
+        end = bisect_right(stamps, stamps[start] + phase_seconds, start)
+        phase_articles = timeline_items[start:end]
+        distribution = {"left": 0, "center": 0, "right": 0, "unknown": 0}
+        for item in phase_articles:
+            distribution[item["bias_bucket"]] += 1
+        phases.append({
+            "start": datetime.fromtimestamp(stamps[start], timezone.utc),
+            "articles": phase_articles,
+            "bias_distribution": distribution
+        })
+        start = end
     
     # Detect narrative shifts
     narrative_shifts = []
@@ -462,10 +746,43 @@ def generate_story_timeline(story: Dict[str, Any]) -> Dict[str, Any]:
 def ensure_title_norm(article: Dict[str, Any]) -> str:
     if "title_norm" not in article or not article["title_norm"]:
         article["title_norm"] = norm_title(article.get("title", ""))
+        article["title_sorted"] = sort_tokens(article["title_norm"])
+    elif "title_sorted" not in article:
+        article["title_sorted"] = sort_tokens(article["title_norm"])
     if "keywords" not in article or not article["keywords"]:
         article["keywords"] = list(extract_keywords(article.get("title", "")))
     return article["title_norm"]
 
+def score_candidates(
+    matches: List[Tuple[str, float, int]],
+    cand_ids: List[int],
+    a_bits: int,
+    stories_bits: List[int]
+) -> Tuple[int, float]:
+    """Best (story index, combined score) among rapidfuzz matches.
+
+    Keyword overlap is the Jaccard index of the keyword bitsets, computed
+    inline as this is the innermost clustering loop. Ties go to the lowest
+    story index, as in a scan in story order.
+    """
+    best_i = -1
+    best_s = -1
+    text_weight = TEXT_WEIGHT
+    kw_weight = KEYWORD_WEIGHT
+    for _, text_sim, j in matches:
+        i = cand_ids[j]
+        st_bits = stories_bits[i]
+        if a_bits and st_bits:
+            kw_overlap = (a_bits & st_bits).bit_count() / (a_bits | st_bits).bit_count()
+        else:
+            kw_overlap = 0.0
+        combined_score = (text_sim * text_weight) + (kw_overlap * 100 * kw_weight)
+
+        if combined_score > best_s or (combined_score == best_s and i < best_i):
+            best_s = combined_score
+            best_i = i
+    return best_i, best_s
+
 def cluster_stories(
     articles: List[Dict[str, Any]],
     sources: Dict[str, Any],
@@ -480,58 +797,81 @@ def cluster_stories(
         ensure_title_norm(item)
     
     stories: List[Dict[str, Any]] = []
-    
+    # keyword -> indices of stories containing it; only stories sharing at
+    # least one keyword with an article are scored against it
+    kw_index: Dict[str, List[int]] = {}
+    stories_sorted: List[str] = []
+    stories_bits: List[int] = []
+    kw_bit: Dict[str, int] = {}
+    min_text_sim = max(0, int((threshold - 100 * KEYWORD_WEIGHT) / TEXT_WEIGHT))
+
     print(f"Clustering {len(items)} articles...")
 
     for idx, a in enumerate(items):
-        best_i = -1
-        best_s = -1
         a_norm = ensure_title_norm(a)
+        a_sorted = a["title_sorted"]
         a_keywords = set(a.get("keywords", []))
-
-        for i, st in enumerate(stories):
-            st_norm = st.get("title_norm", "")
-            if not st_norm:
-                continue
-            
-            if a.get("domain") in st.get("domains", set()):
-                continue
-            
-            text_sim = similarity(a_norm, st_norm)
-            st_keywords = set(st.get("keywords", []))
-            kw_overlap = keyword_overlap(a_keywords, st_keywords)
-            combined_score = (text_sim * 0.65) + (kw_overlap * 100 * 0.35)
-            
-            if combined_score > best_s:
-                best_s = combined_score
-                best_i = i
+        a_bits = keyword_bits(a_keywords, kw_bit)
+        a_domain = a.get("domain")
+
+        cands = set().union(*(kw_index.get(kw, ()) for kw in a_keywords))
+        cand_ids = [i for i in sorted(cands)
+                    if stories_sorted[i] and a_domain not in stories[i]["domains"]]
+
+        # Score all candidates in one rapidfuzz call; candidates whose text
+        # similarity cannot reach the threshold even with full keyword
+        # overlap are dropped inside rapidfuzz.
+        matches = process.extract(
+            a_sorted,
+            [stories_sorted[i] for i in cand_ids],
+            scorer=fuzz.ratio,
+            score_cutoff=min_text_sim,
+            limit=None
+        )
+
+        best_i, best_s = score_candidates(matches, cand_ids, a_bits, stories_bits)
 
         if best_s >= threshold and best_i >= 0:
             st = stories[best_i]
             st["articles"].append(a)
             st["domains"].add(a.get("domain", ""))
-            st["keywords"] = list(set(st.get("keywords", [])) | a_keywords)
+            st_keywords = st["keywords"]
+            for kw in a_keywords - st_keywords:
+                kw_index.setdefault(kw, []).append(best_i)
+            st_keywords |= a_keywords
+            stories_bits[best_i] |= a_bits
             st["first_seen"] = min(st["first_seen"], a.get("published") or a.get("fetched_at") or st["first_seen"])
             st["last_seen"] = max(st["last_seen"], a.get("published") or a.get("fetched_at") or st["last_seen"])
             
             if (idx + 1) % 100 == 0:
                 print(f"  Processed {idx + 1}/{len(items)}, {len(stories)} stories")
         else:
+            for kw in a_keywords:
+                kw_index.setdefault(kw, []).append(len(stories))
+            stories_sorted.append(a_sorted)
+            stories_bits.append(a_bits)
             stories.append({
                 "story_id": stable_id("story", a_norm, a.get("link", "")),
                 "title": a.get("title", ""),
                 "title_norm": a_norm,
-                "keywords": list(a_keywords),
+                "title_sorted": a_sorted,
+                "keywords": set(a_keywords),
                 "category": a.get("category") or "Top",
                 "first_seen": a.get("published") or a.get("fetched_at") or "",
                 "last_seen": a.get("published") or a.get("fetched_at") or "",
                 "articles": [a],
-                "domains": set([a.get("domain", "")])
+                "domains": {a.get("domain", "")}
             })
 
     print(f"Created {len(stories)} stories")
 
     # Post-process
+    now_ts = datetime.now(timezone.utc).timestamp()
+    # domain -> (bias bucket, bias score, publisher name)
+    src_idx = {
+        d: (m.get("bias_bucket", "unknown"), float(m.get("bias_score", 0.0)), m.get("name", d))
+        for d, m in sources.items() if m
+    }
     out = []
     for st in stories:
         arts = st["articles"]
@@ -543,15 +883,11 @@ def cluster_stories(
                 by_domain[d] = x
         dedup_arts = list(by_domain.values())
 
-        last_pub = st.get("last_seen")
+        last_ts = parse_ts(st.get("last_seen"))
         freshness = 0.0
-        if last_pub:
-            try:
-                dt = datetime.fromisoformat(last_pub.replace('Z', '+00:00'))
-                hours_old = (datetime.now(timezone.utc) - dt).total_seconds() / 3600
-                freshness = max(0, 48 - hours_old) / 48
-            except:
-                pass
+        if last_ts is not None:
+            hours_old = (now_ts - last_ts) / 3600
+            freshness = max(0, 48 - hours_old) / 48
 
         counts = {"left": 0, "center": 0, "right": 0, "unknown": 0}
         score_sum = 0.0
@@ -560,15 +896,11 @@ def cluster_stories(
 
         for x in dedup_arts:
             d = x.get("domain") or ""
-            meta = sources.get(d)
-            bucket = "unknown"
-            sc = 0.0
-            name = d
-
+            meta = src_idx.get(d)
             if meta:
-                bucket = meta.get("bias_bucket", "unknown")
-                sc = float(meta.get("bias_score", 0.0))
-                name = meta.get("name", d)
+                bucket, sc, name = meta
+            else:
+                bucket, sc, name = "unknown", 0.0, d
 
             x2 = dict(x)
             x2["publisher_name"] = name
@@ -600,14 +932,16 @@ def cluster_stories(
             lean = "Leans Right"
 
         rep = st["title"]
-        rep_norm = st.get("title_norm", norm_title(rep))
-        best_rep_score = -1
-        for x in dedup_arts[:12]:
-            x_norm = ensure_title_norm(x)
-            s = similarity(rep_norm, x_norm)
-            if s > best_rep_score:
-                best_rep_score = s
-                rep = x.get("title", rep)
+        rep_candidates = dedup_arts[:12]
+        for x in rep_candidates:
+            ensure_title_norm(x)
+        best = process.extractOne(
+            st["title_sorted"],
+            [x["title_sorted"] for x in rep_candidates],
+            scorer=fuzz.ratio
+        )
+        if best is not None:
+            rep = rep_candidates[best[2]].get("title", rep)
 
         out.append({
             "story_id": st["story_id"],
@@ -633,6 +967,32 @@ def cluster_stories(
     return out
 
 
+def build_stories_summary(stories: List[Dict[str, Any]]) -> Dict[str, Dict[str, list]]:
+    """Project stories down to the /api/stories fields, grouped by category.
+
+    Each category (plus "All") maps to {"items": [...], "titles_lc": [...]},
+    where titles_lc holds the lowercased titles used for the `q` filter.
+    """
+    by_cat: Dict[str, Dict[str, list]] = {"All": {"items": [], "titles_lc": []}}
+    for s in stories:
+        item = {
+            "story_id": s["story_id"],
+            "title": s["title"],
+            "category": s["category"],
+            "coverage": s["coverage"],
+            "freshness": s.get("freshness", 0),
+            "bias_bar": s["bias_bar"],
+            "bias_score": s["bias_score"],
+            "lean": s["lean"],
+            "last_seen": s.get("last_seen"),
+        }
+        title_lc = (s.get("title") or "").lower()
+        for key in ("All", s.get("category")):
+            group = by_cat.setdefault(key, {"items": [], "titles_lc": []})
+            group["items"].append(item)
+            group["titles_lc"].append(title_lc)
+    return by_cat
+
 def rebuild_stories() -> int:
     db = load_db()
     sources = load_sources()
@@ -642,6 +1002,7 @@ def rebuild_stories() -> int:
     
     stories = cluster_stories(db["articles"], sources)
     db["stories"] = stories
+    db["stories_summary_by_cat"] = build_stories_summary(stories)
     db["trending_topics"] = detect_trending_topics(db["articles"])
     
     save_db(db)
@@ -714,13 +1075,13 @@ def page_trending(request: Request):
 def api_refresh():
     """Refresh articles and rebuild stories"""
     data = refresh_all()
-    return JSONResponse({"ok": True, **data})
+    return ORJSONResponse({"ok": True, **data})
 
 @app.get("/api/meta")
 def api_meta():
     """Get metadata about the database"""
     db = load_db()
-    return JSONResponse({
+    return ORJSONResponse({
         "last_updated": db.get("last_updated"),
         "stories": len(db.get("stories", [])),
         "articles": len(db.get("articles", [])),
@@ -732,40 +1093,63 @@ def api_categories():
     """Get all available categories"""
     feeds = load_feeds()
     cats = sorted(set(["All"] + list(feeds.keys())))
-    return JSONResponse({"categories": cats})
+    return ORJSONResponse({"categories": cats})
+
+# (last_updated, {(category, qq, limit, offset): body}) for one snapshot;
+# replaced as a whole once a rebuild changes last_updated
+STORIES_RESPONSES: Tuple[Optional[str], Dict[Tuple[str, str, int, int], bytes]] = (None, {})
+STORIES_RESPONSES_MAX = 256
+
+def stories_response(db: Dict[str, Any], category: str, qq: str, limit: int, offset: int) -> bytes:
+    """Serialized /api/stories body, cached per snapshot.
+
+    The cache key and the body both come from the snapshot passed in, so a
+    body is never stored under another rebuild's last_updated.
+    """
+    global STORIES_RESPONSES
+    last_updated = db.get("last_updated")
+    cached_for, bodies = STORIES_RESPONSES
+    if cached_for != last_updated:
+        bodies = {}
+        STORIES_RESPONSES = (last_updated, bodies)
+    key = (category, qq, limit, offset)
+    body = bodies.get(key)
+    if body is not None:
+        return body
+
+    summary = db.get("stories_summary_by_cat")
+    if summary is None:
+        # db.json written before the projection existed
+        summary = db["stories_summary_by_cat"] = build_stories_summary(db.get("stories", []))
+
+    group = summary.get(category) or {"items": [], "titles_lc": []}
+    stories = group["items"]
+
+    if qq:
+        stories = [s for s, t in zip(stories, group["titles_lc"]) if qq in t]
+
+    body = orjson.dumps({
+        "last_updated": last_updated,
+        "total": len(stories),
+        "items": stories[offset: offset + limit]
+    })
+    if len(bodies) >= STORIES_RESPONSES_MAX:
+        bodies.pop(next(iter(bodies), None), None)
+    bodies[key] = body
+    return body
 
 @app.get("/api/stories")
 def api_stories(category: str = "All", q: str = "", limit: int = 60, offset: int = 0):
     """Get stories with optional filtering"""
     db = load_db()
-    stories = db.get("stories", [])
-
-    if category and category != "All":
-        stories = [s for s in stories if s.get("category") == category]
-
-    if q.strip():
-        qq = q.strip().lower()
-        stories = [s for s in stories if qq in (s.get("title") or "").lower()]
-
-    limit = max(1, min(limit, 120))
-    offset = max(0, offset)
-    slice_ = stories[offset: offset + limit]
-
-    return JSONResponse({
-        "last_updated": db.get("last_updated"),
-        "total": len(stories),
-        "items": [{
-            "story_id": s["story_id"],
-            "title": s["title"],
-            "category": s["category"],
-            "coverage": s["coverage"],
-            "freshness": s.get("freshness", 0),
-            "bias_bar": s["bias_bar"],
-            "bias_score": s["bias_score"],
-            "lean": s["lean"],
-            "last_seen": s.get("last_seen"),
-        } for s in slice_]
-    })
+    body = stories_response(
+        db,
+        category or "All",
+        q.strip().lower(),
+        max(1, min(limit, 120)),
+        max(0, offset)
+    )
+    return Response(content=body, media_type="application/json")
 
 @app.get("/api/story/{story_id}")
 def api_story(story_id: str):
@@ -773,8 +1157,8 @@ def api_story(story_id: str):
     db = load_db()
     for s in db.get("stories", []):
         if s.get("story_id") == story_id:
-            return JSONResponse(s)
-    return JSONResponse({"error": "not_found"}, status_code=404)
+            return ORJSONResponse(s)
+    return ORJSONResponse({"error": "not_found"}, status_code=404)
 
 @app.get("/api/story/{story_id}/timeline")
 def api_story_timeline(story_id: str):
@@ -783,15 +1167,15 @@ def api_story_timeline(story_id: str):
     for s in db.get("stories", []):
         if s.get("story_id") == story_id:
             timeline = generate_story_timeline(s)
-            return JSONResponse(timeline)
-    return JSONResponse({"error": "not_found"}, status_code=404)
+            return ORJSONResponse(timeline)
+    return ORJSONResponse({"error": "not_found"}, status_code=404)
 
 @app.get("/api/blindspots")
 def api_blindspots(min_cov: int = 4):
     """Get stories that show bias blindspots"""
     db = load_db()
     items = compute_blindspots(db.get("stories", []), min_cov=min_cov)
-    return JSONResponse({
+    return ORJSONResponse({
         "last_updated": db.get("last_updated"),
         "items": items
     })
@@ -800,7 +1184,7 @@ def api_blindspots(min_cov: int = 4):
 def api_trending():
     """Get trending topics based on keyword analysis"""
     db = load_db()
-    return JSONResponse({
+    return ORJSONResponse({
         "last_updated": db.get("last_updated"),
         "topics": db.get("trending_topics", [])
     })
@@ -808,10 +1192,10 @@ def api_trending():
 @app.get("/api/sources")
 def api_sources():
     """Get all news sources with bias information"""
-    return JSONResponse(load_sources())
+    return ORJSONResponse(load_sources())
 
 @app.post("/api/rebuild")
 def api_rebuild():
     """Rebuild stories from existing articles"""
     n = rebuild_stories()
-    return JSONResponse({"ok": True, "stories": n, "updated_at": now_iso()})
\ No newline at end of file
+    return ORJSONResponse({"ok": True, "stories": n, "updated_at": now_iso()})
\ No newline at end of file